@@ -11,22 +11,55 @@ https://openweathermap.org/api/pollution/so2,
 https://openweathermap.org/api/pollution/no2
 """
 
-import logging
-from io import StringIO
-import zlib
+from concurrent.futures import Future
+import copy
 import json
-from collections import OrderedDict
+import logging
+import os
 from urllib.parse import urljoin
+from cachetools import TTLCache
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 import marshmallow as ma
 
+try:
+    # optional: faster JSON decoding
+    from orjson import loads as json_loads
+except ImportError:
+    try:
+        from msgspec.json import decode as json_loads
+    except ImportError:
+        from json import loads as json_loads
+
+try:
+    # optional: faster gzip decompression (Intel ISA-L)
+    from isal.igzip import GzipFile
+except ImportError:
+    from gzip import GzipFile
+
+try:
+    # optional: incremental JSON parsing, to stream the city list
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    # optional: platform specific user cache directory
+    from platformdirs import user_cache_dir
+except ImportError:
+    def user_cache_dir(appname):
+        """Return the user cache directory of an application."""
+        return os.path.join(os.path.expanduser('~'), '.cache', appname)
+
 from . import _LOGGER_NAME
 from .schemas import (
-    ForecastSchema, CurrentWeatherSchema, CurrentWeatherSearchSchema,
-    UVIndexSchema,
-    AirPollutionCarbonMonoxydeSchema, AirPollutionOzoneSchema,
-    AirPollutionSulfurDioxideSchema, AirPollutionNitrogenDioxideSchema,
-    CitySchema)
+    CITY_LIST_SCHEMA, FORECAST_SCHEMA,
+    CURRENT_WEATHER_SCHEMA, CURRENT_WEATHER_SEARCH_SCHEMA,
+    AIR_POLLUTION_CARBON_MONOXYDE_SCHEMA, AIR_POLLUTION_OZONE_SCHEMA,
+    AIR_POLLUTION_SULFUR_DIOXIDE_SCHEMA, AIR_POLLUTION_NITROGEN_DIOXIDE_SCHEMA,
+    UV_INDEX_SCHEMA, UV_INDEX_LIST_SCHEMA)
 from .exceptions import (
     OpenWeatherMapClientError, OWMClientKeyNotDefinedError,
     OWMClientUnknownServiceNameError, OWMClientAccessLimitationError,
@@ -40,12 +73,38 @@ _API_POLLUTION_VERSION = 'v1'
 _DEFAULT_USESSL = True
 _DEFAULT_UNITS = 'metric'
 _DEFAULT_MAX_RETRIES = 5
+_DEFAULT_BACKOFF_FACTOR = 0.5
+_RETRY_STATUS_CODES = (502, 503, 504,)
 _DEFAULT_TIMEOUT = 10
+_DEFAULT_POOL_MAXSIZE = 10
+_DEFAULT_CACHE_DIR = user_cache_dir('openweathermap-client')
+_DEFAULT_CACHE_TTL = 600
+_DEFAULT_CACHE_MAXSIZE = 1024
+
+_CITY_LIST_CACHE_FILENAME = 'city.list.json'
+_CITY_LIST_VALIDATORS_FILENAME = 'city.list.validators.json'
+
+# every content-coding urllib3 can decode (brotli when installed)
+_ACCEPT_ENCODING = make_headers(accept_encoding=True)['accept-encoding']
+
+_GROUP_MAX_CITIES = 20
+
+_SEARCH_TYPES = frozenset((None, 'like', 'accurate',))
+_CLUSTER_VALUES = frozenset((None, 'yes', 'no',))
 
 
 logger = logging.getLogger(_LOGGER_NAME)
 
 
+def _is_choice(value, choices):
+    """Return True if value is one of choices (a frozenset)."""
+    try:
+        return value in choices
+    except TypeError:
+        # unhashable value, can not be a choice
+        return False
+
+
 class OpenWeatherMapClient():
     """OpenWeatherMap API client class."""
 
@@ -53,63 +112,69 @@ class OpenWeatherMapClient():
         'city_list': {
             # url list taken from https://openweathermap.org/appid#work
             'uri': 'http://bulk.openweathermap.org/sample/city.list.json.gz',
-            'schema': {'name': CitySchema, 'many': True},
+            'schema': CITY_LIST_SCHEMA,
             'description': 'Cities\' IDs list.'},
         'forecast_5d': {
-            'uri': '/data/{v}/forecast'.format(v=_API_DATA_VERSION),
-            'schema': {'name': ForecastSchema, 'many': False},
+            'uri': f'/data/{_API_DATA_VERSION}/forecast',
+            'schema': FORECAST_SCHEMA,
             'description': 'Forecast 5 day / 3 hour for a location.'},
         'current_weather': {
-            'uri': '/data/{v}/weather'.format(v=_API_DATA_VERSION),
-            'schema': {'name': CurrentWeatherSchema, 'many': False},
-            'description': 'Current weather for a location.'},
+            'uri': f'/data/{_API_DATA_VERSION}/weather',
+            'schema': CURRENT_WEATHER_SCHEMA,
+            'description': 'Current weather for a location.',
+            'cacheable': True},
         'current_weather_box': {
-            'uri': '/data/{v}/box/city'.format(v=_API_DATA_VERSION),
-            'schema': {'name': CurrentWeatherSearchSchema, 'many': False},
+            'uri': f'/data/{_API_DATA_VERSION}/box/city',
+            'schema': CURRENT_WEATHER_SEARCH_SCHEMA,
             'description': 'Current weather within a geographical box.'},
         'current_weather_circle': {
-            'uri': '/data/{v}/find'.format(v=_API_DATA_VERSION),
-            'schema': {'name': CurrentWeatherSearchSchema, 'many': False},
+            'uri': f'/data/{_API_DATA_VERSION}/find',
+            'schema': CURRENT_WEATHER_SEARCH_SCHEMA,
             'description': 'Current weather within a geographical circle.'},
         'current_weather_group': {
-            'uri': '/data/{v}/group'.format(v=_API_DATA_VERSION),
-            'schema': {'name': CurrentWeatherSearchSchema, 'many': False},
+            'uri': f'/data/{_API_DATA_VERSION}/group',
+            'schema': CURRENT_WEATHER_SEARCH_SCHEMA,
             'description': 'Current weather for a group of cities.'},
         'air_pollution_carbon_monoxyde': {
-            'uri': '/pollution/{v}/co/'.format(v=_API_POLLUTION_VERSION),
-            'schema': {
-                'name': AirPollutionCarbonMonoxydeSchema, 'many': False},
-            'description': 'Carbon monoxyde for a location and time.'},
+            'uri': f'/pollution/{_API_POLLUTION_VERSION}/co/',
+            'schema': AIR_POLLUTION_CARBON_MONOXYDE_SCHEMA,
+            'description': 'Carbon monoxyde for a location and time.',
+            'cacheable': True},
         'air_pollution_ozone': {
-            'uri': '/pollution/{v}/o3/'.format(v=_API_POLLUTION_VERSION),
-            'schema': {'name': AirPollutionOzoneSchema, 'many': False},
-            'description': 'Ozone for a location and time.'},
+            'uri': f'/pollution/{_API_POLLUTION_VERSION}/o3/',
+            'schema': AIR_POLLUTION_OZONE_SCHEMA,
+            'description': 'Ozone for a location and time.',
+            'cacheable': True},
         'air_pollution_sulfur_dioxide': {
-            'uri': '/pollution/{v}/so2/'.format(v=_API_POLLUTION_VERSION),
-            'schema': {'name': AirPollutionSulfurDioxideSchema, 'many': False},
-            'description': 'Sulfur dioxide for a location and time.'},
+            'uri': f'/pollution/{_API_POLLUTION_VERSION}/so2/',
+            'schema': AIR_POLLUTION_SULFUR_DIOXIDE_SCHEMA,
+            'description': 'Sulfur dioxide for a location and time.',
+            'cacheable': True},
         'air_pollution_nitrogen_dioxide': {
-            'uri': '/pollution/{v}/no2/'.format(v=_API_POLLUTION_VERSION),
-            'schema': {
-                'name': AirPollutionNitrogenDioxideSchema, 'many': False},
-            'description': 'Nitrogen dioxide for a location and time.'},
+            'uri': f'/pollution/{_API_POLLUTION_VERSION}/no2/',
+            'schema': AIR_POLLUTION_NITROGEN_DIOXIDE_SCHEMA,
+            'description': 'Nitrogen dioxide for a location and time.',
+            'cacheable': True},
         'uv_index_current': {
-            'uri': '/data/{v}/uvi'.format(v=_API_DATA_VERSION),
-            'schema': {'name': UVIndexSchema, 'many': False},
-            'description': 'UV index for a location.'},
+            'uri': f'/data/{_API_DATA_VERSION}/uvi',
+            'schema': UV_INDEX_SCHEMA,
+            'description': 'UV index for a location.',
+            'cacheable': True},
         'uv_index_forecast': {
-            'uri': '/data/{v}/uvi/forecast'.format(v=_API_DATA_VERSION),
-            'schema': {'name': UVIndexSchema, 'many': True},
+            'uri': f'/data/{_API_DATA_VERSION}/uvi/forecast',
+            'schema': UV_INDEX_LIST_SCHEMA,
             'description': 'Forecast UV index for a location.'},
         'uv_index_historical': {
-            'uri': '/data/{v}/uvi/history'.format(v=_API_DATA_VERSION),
-            'schema': {'name': UVIndexSchema, 'many': True},
+            'uri': f'/data/{_API_DATA_VERSION}/uvi/history',
+            'schema': UV_INDEX_LIST_SCHEMA,
             'description': 'Historical UV index for a location.'},
     }
+    _AVAILABLE_SERVICES_LIST = ', '.join(_AVAILABLE_SERVICES)
 
     def __init__(self, api_key, *, use_ssl=_DEFAULT_USESSL, host=_API_HOST,
                  units=_DEFAULT_UNITS, max_retries=_DEFAULT_MAX_RETRIES,
-                 timeout=_DEFAULT_TIMEOUT):
+                 timeout=_DEFAULT_TIMEOUT, cache_dir=_DEFAULT_CACHE_DIR,
+                 cache_ttl=_DEFAULT_CACHE_TTL):
         """
         :param str api_key: API key used to call the API.
         :param bool use_ssl: (optional, default True)
@@ -121,6 +186,14 @@ class OpenWeatherMapClient():
         :param float|tuple timeout: (optional, default 10)
             API requests timeout, in seconds. Set `None` to wait forever.
             A 2 floats tuple defines separately connection and request timeout.
+        :param str cache_dir: (optional, default user cache directory)
+            Directory where downloaded files (city list) are cached, and only
+            downloaded again when modified. Set `None` to disable cache.
+        :param int cache_ttl: (optional, default 600)
+            Time, in seconds, during which responses of cacheable services
+            (current weather, air pollution, current UV index) are kept in
+            memory and loaded again without calling the API.
+            Set `None` or 0 to disable cache.
         :param str units: (optional, default metric)
             Units format. standard, metric, and imperial units are available.
             See https://openweathermap.org/weather-data
@@ -130,38 +203,126 @@ class OpenWeatherMapClient():
 
         self.api_key = api_key
         self.host = host or _API_HOST
+        self._session = None
         self.max_retries = max_retries
-        if max_retries < 0:
-            self.max_retries = _DEFAULT_MAX_RETRIES
         self.timeout = timeout
         self.units = units
-
-        self._base_uri = 'http{ssl}://{host}'.format(
-            ssl='s' if use_ssl else '', host=self.host)
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
+
+        self._base_uri = f'http{"s" if use_ssl else ""}://{self.host}'
+        # absolute uri of each service (some are already absolute)
+        self._service_uris = {
+            service_name: urljoin(self._base_uri, service_info['uri'])
+            for service_name, service_info in self._AVAILABLE_SERVICES.items()
+        }
         self._base_uri_params = {
             'appid': self.api_key,
             'units': self.units,
         }
+        self._base_uri_params_no_units = {'appid': self.api_key}
+
+        self._cache = None
+        if cache_ttl:
+            self._cache = TTLCache(
+                maxsize=_DEFAULT_CACHE_MAXSIZE, ttl=cache_ttl)
 
-        self.last_uri_call = None
+        self._last_uri_call = None
         self.last_uri_call_tries = 0
 
+        # city IDs waiting to be retrieved by groups: {city_id: [future]}
+        self._pending_loads = {}
+
+        self._session = self._create_session()
+
         logger.debug(
             'OpenWeatherMap API client initialized. Host: %s', self.host)
 
     def __repr__(self):
         return (
-            '<{self.__class__.__name__}('
-            'api_key="{self.api_key}"'
-            ', base_uri={self._base_uri}'
-            ', max_retries={self.max_retries}'
-            ')>'.format(self=self))
+            f'<{self.__class__.__name__}('
+            f'api_key="{self.api_key}"'
+            f', base_uri={self._base_uri}'
+            f', max_retries={self.max_retries}'
+            ')>')
+
+    @property
+    def max_retries(self):
+        """Number max of retries if errors occured while calling the API."""
+        return self._max_retries
+
+    @max_retries.setter
+    def max_retries(self, max_retries):
+        if max_retries < 0:
+            max_retries = _DEFAULT_MAX_RETRIES
+        self._max_retries = max_retries
+        if self._session is not None:
+            self._set_session_retries()
+
+    def _build_retry(self):
+        """Return the urllib3 retry configuration of API calls."""
+        return Retry(
+            total=self.max_retries, backoff_factor=_DEFAULT_BACKOFF_FACTOR,
+            status_forcelist=_RETRY_STATUS_CODES, raise_on_status=False)
+
+    def _set_session_retries(self):
+        """Apply max_retries to the HTTP session."""
+        retry = self._build_retry()
+        for adapter in self._session.adapters.values():
+            adapter.max_retries = retry
+
+    def _create_session(self):
+        """Return an HTTP session, reusing connections (HTTP keep-alive)
+        between API calls, retrying failed calls with an exponential
+        backoff and accepting compressed responses."""
+        session = requests.Session()
+        session.headers['Accept-Encoding'] = _ACCEPT_ENCODING
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=_DEFAULT_POOL_MAXSIZE,
+            max_retries=self._build_retry())
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the HTTP session and release its pooled connections."""
+        self._session.close()
 
     @property
     def available_services(self):
         """List all available services (implemented calls of API endpoints)."""
         return self._AVAILABLE_SERVICES
 
+    @property
+    def last_uri_call(self):
+        """Human readable last called uri, with its query parameters."""
+        if self._last_uri_call is None:
+            return None
+        return self._readable_uri(*self._last_uri_call)
+
+    @staticmethod
+    def _readable_uri(uri, params):
+        """Return an uri with its query parameters, hiding the API key."""
+        parts = []
+        for key, value in params.items():
+            if key == 'appid':
+                # do not expose API key
+                value = 'XxX'
+            parts.append(f'{key}={value}')
+        return '?'.join([uri, '&'.join(parts)])
+
+    def _set_last_uri_call(self, uri, params):
+        """Reset last_uri_call and last_uri_call_tries before a request."""
+        # human readable uri is only built when needed (logs, errors...)
+        self._last_uri_call = (uri, params,)
+        self.last_uri_call_tries = 0
+
     def _get(self, uri, **kwargs):
         """Send a GET request, using max retries if call failed.
 
@@ -176,99 +337,145 @@ class OpenWeatherMapClient():
         :raises requests.exceptions.HTTPError:
             When response status code is not OK (and max retries reached).
         """
-        # build a human readable uri with query parameters
-        self.last_uri_call = '?'.join([
-            uri, '&'.join([
-                '{}={}'.format(k, v if k != 'appid' else 'XxX')
-                for k, v in kwargs.get('params', {}).items()])
-        ])
-        self.last_uri_call_tries = 0
+        self._set_last_uri_call(uri, kwargs.get('params', {}))
 
-        is_success = False
-        while not is_success and self.last_uri_call_tries <= self.max_retries:
-            self.last_uri_call_tries += 1
-            try:
-                # send request and receive response
-                response = requests.get(uri, timeout=self.timeout, **kwargs)
-            except (requests.ConnectionError, requests.Timeout,) as src_exc:
-                logger.warning(
-                    '%i/%i GET %s: %s', self.last_uri_call_tries,
-                    self.max_retries, self.last_uri_call, src_exc)
-                response = None
-                if self.last_uri_call_tries >= self.max_retries:
-                    exc = OpenWeatherMapClientError(str(src_exc))
-                    logger.error('GET %s: %s', self.last_uri_call, exc)
-                    raise exc
-
-            if response is not None:
-                # is response ok (200) ?
-                if response.status_code != requests.codes.ok:
-                    if self.last_uri_call_tries >= self.max_retries:
-                        # is response a bad gateway (502) code ?
-                        if response.status_code == requests.codes.bad_gateway:
-                            limit_exc = OWMClientAccessLimitationError(
-                                'For example, OpenWeatherMap free edition only'
-                                'allows 60 API calls per minute!')
-                            logger.error(
-                                'GET %s: %s', self.last_uri_call, limit_exc)
-                            raise limit_exc
-                        response.raise_for_status()
-                # no exception at all...
-                elif self.last_uri_call_tries < self.max_retries:
-                    is_success = True
+        try:
+            # send request and receive response (retries are handled by the
+            # session's adapter)
+            response = self._session.get(uri, timeout=self.timeout, **kwargs)
+        except (requests.ConnectionError, requests.Timeout,) as src_exc:
+            self.last_uri_call_tries = self.max_retries + 1
+            exc = OpenWeatherMapClientError(str(src_exc))
+            logger.error('GET %s: %s', self.last_uri_call, exc)
+            raise exc
+
+        retries = getattr(response.raw, 'retries', None)
+        self.last_uri_call_tries = (
+            len(retries.history) + 1 if retries is not None else 1)
+
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            # is response a bad gateway (502) code ?
+            if response.status_code == requests.codes.bad_gateway:
+                limit_exc = OWMClientAccessLimitationError(
+                    'For example, OpenWeatherMap free edition only'
+                    'allows 60 API calls per minute!')
+                logger.error('GET %s: %s', self.last_uri_call, limit_exc)
+                raise limit_exc
+            raise
 
         return response
 
-    def _get_data(self, service_name, *, extra_uri=None, params=None,
-                  with_units=True):
-        """Send GET request to retrieve data from a service.
+    def _get_service_info(self, service_name):
+        """Return information (uri, schema, ...) of a service.
 
         :param str service_name:
             The service name to call. See available_services property.
-        :param str extra_uri: (optional, default None)
-        :param dict params: (optional, default None)
-            The query parameters to pass in request.
+        :raises OWMClientUnknownServiceNameError:
+            When service name is not available.
         """
-        if service_name not in self._AVAILABLE_SERVICES.keys():
+        if service_name not in self._AVAILABLE_SERVICES:
             exc_serv = OWMClientUnknownServiceNameError(
-                'Invalid service name: {}. Available services are: {}'.format(
-                    service_name, ', '.join(self._AVAILABLE_SERVICES.keys())))
+                f'Invalid service name: {service_name}. Available services '
+                f'are: {self._AVAILABLE_SERVICES_LIST}')
             logger.error(str(exc_serv))
             raise exc_serv
+        return self._AVAILABLE_SERVICES[service_name]
 
-        # get service information (uri, schema, ...)
-        service_info = self._AVAILABLE_SERVICES[service_name]
+    def _build_cache_key(self, service_name, extra_uri=None, params=None):
+        """Return the in-memory cache key of a service call, or None when
+        the service response must not be cached."""
+        if (self._cache is None or
+                not self._AVAILABLE_SERVICES[service_name].get('cacheable')):
+            return None
+        return (service_name, extra_uri, frozenset((params or {}).items()))
 
-        # build uri
-        uri = urljoin(self._base_uri, service_info['uri'])
-        if extra_uri is not None:
-            uri = urljoin(uri, extra_uri)
-
-        # prepare query parameters
-        query_params = params or OrderedDict()
-        query_params.update(self._base_uri_params)
-        if not with_units:
-            query_params.pop('units')
-        # send request and receive response
-        response = self._get(uri, params=query_params)
-
-        # default response format is JSON and this is great !
-        resp_data = response.json()
+    def _build_uri(self, service_name, extra_uri=None):
+        """Return the absolute uri of a service.
 
+        :param str extra_uri: (optional, default None)
+            Relative path appended to service uri (which ends with a '/').
+        """
+        uri = self._service_uris[service_name]
+        if extra_uri is not None:
+            uri += extra_uri
+        return uri
+
+    def _build_query_params(self, params=None, with_units=True):
+        """Return the query parameters to pass in a service request."""
+        base_params = (
+            self._base_uri_params if with_units
+            else self._base_uri_params_no_units)
+        if params is None:
+            return base_params.copy()
+        # service parameters first (some services require this order)
+        return {**params, **base_params}
+
+    def _load_response_data(self, service_info, resp_data, uri, params):
+        """Check and deserialize the JSON data of a service response.
+
+        :param dict service_info: Information of the called service.
+        :param dict resp_data: The JSON data of the response.
+        :param str uri: The called uri (for error messages).
+        :param dict params: The query parameters (for error messages).
+        :raises OpenWeatherMapClientError: When response data is an error.
+        """
         # is resp_data an error ?
         if 'error' in resp_data:
-            exc = OpenWeatherMapClientError('{} on GET {}'.format(
-                resp_data['error'], self.last_uri_call))
+            exc = OpenWeatherMapClientError(
+                f'{resp_data["error"]} on GET '
+                f'{self._readable_uri(uri, params)}')
             logger.error(str(exc))
             raise exc
 
         # deserialize API response
         return self._deserialize_with_schema(service_info['schema'], resp_data)
 
+    def _get_data(self, service_name, *, extra_uri=None, params=None,
+                  with_units=True):
+        """Send GET request to retrieve data from a service.
+
+        :param str service_name:
+            The service name to call. See available_services property.
+        :param str extra_uri: (optional, default None)
+        :param dict params: (optional, default None)
+            The query parameters to pass in request.
+        """
+        # get service information (uri, schema, ...)
+        service_info = self._get_service_info(service_name)
+
+        # build uri and prepare query parameters
+        uri = self._build_uri(service_name, extra_uri)
+        query_params = self._build_query_params(params, with_units)
+
+        # recently retrieved data ? (raw JSON data is cached and loaded
+        # again, so that callers never share a mutable result)
+        cache_key = self._build_cache_key(service_name, extra_uri, params)
+        resp_data = None
+        if cache_key is not None:
+            resp_data = self._cache.get(cache_key)
+        is_cached = resp_data is not None
+
+        if not is_cached:
+            # send request and receive response
+            response = self._get(uri, params=query_params)
+            # default response format is JSON and this is great !
+            resp_data = json_loads(response.content)
+
+        result = self._load_response_data(
+            service_info, resp_data, uri, query_params)
+        if cache_key is not None and not is_cached:
+            self._cache[cache_key] = resp_data
+        return result
+
     @staticmethod
-    def _deserialize_with_schema(data_schema_info, json_data):
-        """Use a marshmallow schema to deserialize JSON data."""
-        data_schema = data_schema_info['name'](many=data_schema_info['many'])
+    def _deserialize_with_schema(data_schema, json_data):
+        """Use a marshmallow schema to deserialize JSON data.
+
+        :param marshmallow.Schema data_schema:
+            The schema instance of a service (see available_services).
+        """
         try:
             # validate and deserialized data
             return data_schema.load(json_data)[0]
@@ -277,11 +484,107 @@ class OpenWeatherMapClient():
             logger.error(str(exc))
             raise exc
 
+    def _city_list_cache_path(self, filename):
+        return os.path.join(self.cache_dir, filename)
+
+    def _read_city_list_validators(self):
+        """Return the validators (HTTP headers) of the cached city list, or
+        None if not available.
+
+        :returns dict: etag and last_modified of the cached city list.
+        """
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(self._city_list_cache_path(
+                    _CITY_LIST_VALIDATORS_FILENAME), 'rb') as cache_file:
+                validators = json_loads(cache_file.read())
+            if not os.path.isfile(
+                    self._city_list_cache_path(_CITY_LIST_CACHE_FILENAME)):
+                return None
+            return {
+                'etag': validators['etag'],
+                'last_modified': validators['last_modified'],
+            }
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            logger.warning('Invalid city list cache: %s', exc)
+            return None
+
+    def _read_city_list_data(self):
+        """Return the JSON data of the cached city list.
+
+        Only read when the server confirmed (304) the cached list is valid.
+        """
+        with open(self._city_list_cache_path(
+                _CITY_LIST_CACHE_FILENAME), 'rb') as cache_file:
+            return json_loads(cache_file.read())
+
+    @staticmethod
+    def _write_cache_file(cache_path, content):
+        """Write a cache file at once (no partially written file)."""
+        with open(cache_path + '.tmp', 'wb') as cache_file:
+            cache_file.write(content)
+        os.replace(cache_path + '.tmp', cache_path)
+
+    def _write_city_list_cache(self, resp_headers, json_bytes):
+        """Cache the city list (raw JSON data) along with its validators
+        (HTTP headers)."""
+        if self.cache_dir is None:
+            return
+        validators = {
+            'etag': resp_headers.get('ETag'),
+            'last_modified': resp_headers.get('Last-Modified'),
+        }
+        if validators['etag'] is None and validators['last_modified'] is None:
+            # response could not be revalidated, do not cache it
+            return
+        validators_path = self._city_list_cache_path(
+            _CITY_LIST_VALIDATORS_FILENAME)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # validators must never refer to other data than the cached one
+            try:
+                os.remove(validators_path)
+            except FileNotFoundError:
+                pass
+            self._write_cache_file(
+                self._city_list_cache_path(_CITY_LIST_CACHE_FILENAME),
+                json_bytes)
+            self._write_cache_file(
+                validators_path, json.dumps(validators).encode())
+        except OSError as exc:
+            logger.warning('City list cache not written: %s', exc)
+
+    @staticmethod
+    def _city_list_request_headers(validators):
+        """Return conditional request headers for a cached city list."""
+        headers = {}
+        if validators is not None:
+            if validators['etag'] is not None:
+                headers['If-None-Match'] = validators['etag']
+            if validators['last_modified'] is not None:
+                headers['If-Modified-Since'] = validators['last_modified']
+        return headers
+
+    @staticmethod
+    def _read_city_list(file_obj):
+        """Decompress the raw JSON data of the city list file.
+
+        :param file_obj: Binary file-like object of the gzipped file.
+        """
+        # decompress file data while reading it
+        with GzipFile(fileobj=file_obj) as gz_file:
+            return gz_file.read()
+
     def get_city_list(self, *, validate_with_schema=True):
         """Retrieve all cities information, including cities' IDs list.
         In fact, there is more data than only IDs (names, coordinates...).
 
         A JSON compressed file is downloaded and serialized as objects.
+        The file is cached (see cache_dir) and only downloaded again if it
+        has been modified on server.
 
         ..Note:
             Use API by city ID (instead of city name, city coordinates or
@@ -294,19 +597,25 @@ class OpenWeatherMapClient():
             conversion is done (for example timestamps to datetimes).
         """
         # get service information (uri, schema, ...)
-        service_name = 'city_list'
-        service_info = self._AVAILABLE_SERVICES[service_name]
+        service_info = self._AVAILABLE_SERVICES['city_list']
+        validators = self._read_city_list_validators()
 
         # send request and receive response
-        response = self._get(service_info['uri'], stream=True)
-
-        # decompress downloaded file data
-        zlib_obj = zlib.decompressobj(16 + zlib.MAX_WBITS)
-        response_data = str(zlib_obj.decompress(response.content), 'utf-8')
-
-        # create a stream with the string response and load JSON data
-        io_data = StringIO(response_data)
-        json_data = json.load(io_data)
+        response = self._get(
+            self._service_uris['city_list'], stream=True,
+            headers=self._city_list_request_headers(validators))
+
+        # streamed response connection is released once done
+        with response:
+            if response.status_code == requests.codes.not_modified:
+                json_data = self._read_city_list_data()
+            else:
+                # read response body as it is downloaded (never buffered
+                # whole in memory), undoing any content-encoding
+                response.raw.decode_content = True
+                json_bytes = self._read_city_list(response.raw)
+                self._write_city_list_cache(response.headers, json_bytes)
+                json_data = json_loads(json_bytes)
 
         if not validate_with_schema:
             return json_data
@@ -314,6 +623,42 @@ class OpenWeatherMapClient():
         # deserialize API response into a marshmallow schema
         return self._deserialize_with_schema(service_info['schema'], json_data)
 
+    def iter_city_list(self):
+        """Iterate over all cities information, as raw JSON data (same as
+        get_city_list with validate_with_schema=False).
+
+        When ijson is installed, cities are yielded while the compressed file
+        is downloaded, so that the whole list is never held in memory. In
+        that case, the file is not cached (see cache_dir), but a cached file
+        is still used if it has not been modified on server.
+        """
+        if ijson is None:
+            yield from self.get_city_list(validate_with_schema=False)
+            return
+
+        # cached list is only loaded if it has not been modified
+        validators = self._read_city_list_validators()
+
+        # send request and receive response
+        response = self._get(
+            self._service_uris['city_list'], stream=True,
+            headers=self._city_list_request_headers(validators))
+
+        with response:
+            if response.status_code == requests.codes.not_modified:
+                yield from self._read_city_list_data()
+                return
+            response.raw.decode_content = True
+            with GzipFile(fileobj=response.raw) as gz_file:
+                yield from ijson.items(gz_file, 'item', use_float=True)
+
+    def city_id_index(self):
+        """Return all cities information (raw JSON data) by city ID.
+
+        Cities are streamed by iter_city_list to build the index.
+        """
+        return {city['id']: city for city in self.iter_city_list()}
+
     def get_forecast_by_city_id(self, city_id):
         """Search for weather forecast (5 day / 3 hour) by city id.
 
@@ -346,18 +691,17 @@ class OpenWeatherMapClient():
                 'accurate' to get exact match city name result.
         :raises ValueError: When search_type value is invalid.
         """
-        query_params = {'q': city_name}
-        if country_code is not None:
-            query_params['q'] = '{},{}'.format(city_name, country_code)
-        if search_type in (None, 'like', 'accurate',):
-            if search_type is not None:
-                query_params.update({'type': search_type})
-        else:
+        if not _is_choice(search_type, _SEARCH_TYPES):
             exc = ValueError(
-                'Invalid search_type: {}. Expected are: None/like/accurate.'
-                .format(search_type))
+                f'Invalid search_type: {search_type}. '
+                'Expected are: None/like/accurate.')
             logger.warning(str(exc))
             raise exc
+        query_params = {
+            'q': (city_name if country_code is None
+                  else f'{city_name},{country_code}')}
+        if search_type is not None:
+            query_params['type'] = search_type
         return self._get_data('forecast_5d', params=query_params)
 
     def get_forecast_by_zip_code(self, zip_code, country_code):
@@ -367,7 +711,7 @@ class OpenWeatherMapClient():
         :param str zip_code: The zip code of the city to watch.
         :param str country_code: ISO 3166 country code of the city to watch.
         """
-        query_params = {'zip': '{},{}'.format(zip_code, country_code)}
+        query_params = {'zip': f'{zip_code},{country_code}'}
         return self._get_data('forecast_5d', params=query_params)
 
     def get_current_weather_by_city_id(self, city_id):
@@ -399,18 +743,17 @@ class OpenWeatherMapClient():
                 'accurate' to get exact match city name result.
         :raises ValueError: When search_type value is invalid.
         """
-        query_params = {'q': city_name}
-        if country_code is not None:
-            query_params['q'] = '{},{}'.format(city_name, country_code)
-        if search_type in (None, 'like', 'accurate',):
-            if search_type is not None:
-                query_params.update({'type': search_type})
-        else:
+        if not _is_choice(search_type, _SEARCH_TYPES):
             exc = ValueError(
-                'Invalid search_type: {}. Expected are: None/like/accurate.'
-                .format(search_type))
+                f'Invalid search_type: {search_type}. '
+                'Expected are: None/like/accurate.')
             logger.warning(str(exc))
             raise exc
+        query_params = {
+            'q': (city_name if country_code is None
+                  else f'{city_name},{country_code}')}
+        if search_type is not None:
+            query_params['type'] = search_type
         return self._get_data('current_weather', params=query_params)
 
     def get_current_weather_by_zip_code(self, zip_code, country_code):
@@ -419,7 +762,7 @@ class OpenWeatherMapClient():
         :param str zip_code: The zip code of the city to watch.
         :param str country_code: ISO 3166 country code of the city to watch.
         """
-        query_params = {'zip': '{},{}'.format(zip_code, country_code)}
+        query_params = {'zip': f'{zip_code},{country_code}'}
         return self._get_data('current_weather', params=query_params)
 
     def get_current_weather_within_box(
@@ -436,21 +779,19 @@ class OpenWeatherMapClient():
         :raises ValueError: When box or cluster value is invalid.
         """
         if len(box) != 4:
-            exc = ValueError('Invalid box: {}'.format(box))
+            exc = ValueError(f'Invalid box: {box}')
             logger.warning(str(exc))
             raise exc
-        box.extend([zoom])
-        query_params = {'bbox': ','.join([str(coord) for coord in box])}
-        if cluster in (None, 'yes', 'no',):
-            if cluster is not None:
-                query_params.update({'cluster': cluster})
-        else:
-            exc = ValueError('Invalid cluster: {}. Expected are: None/yes/no.'
-                             .format(cluster))
+        if not _is_choice(cluster, _CLUSTER_VALUES):
+            exc = ValueError(
+                f'Invalid cluster: {cluster}. Expected are: None/yes/no.')
             logger.warning(str(exc))
             raise exc
+        query_params = {'bbox': ','.join(map(str, (*box, zoom)))}
+        if cluster is not None:
+            query_params['cluster'] = cluster
         if lang is not None:
-            query_params.update({'lang': lang})
+            query_params['lang'] = lang
         return self._get_data('current_weather_box', params=query_params)
 
     def get_current_weather_within_circle(
@@ -469,18 +810,17 @@ class OpenWeatherMapClient():
         :param str lang: (optional, default None) Language to use.
         :raises ValueError: When cluster value is invalid.
         """
-        query_params = {'lat': latitude, 'lon': longitude}
-        query_params['cnt'] = max(0, min(cnt, 50))
-        if cluster in (None, 'yes', 'no',):
-            if cluster is not None:
-                query_params.update({'cluster': cluster})
-        else:
-            exc = ValueError('Invalid cluster: {}. Expected are: None/yes/no.'
-                             .format(cluster))
+        if not _is_choice(cluster, _CLUSTER_VALUES):
+            exc = ValueError(
+                f'Invalid cluster: {cluster}. Expected are: None/yes/no.')
             logger.warning(str(exc))
             raise exc
+        query_params = {
+            'lat': latitude, 'lon': longitude, 'cnt': max(0, min(cnt, 50))}
+        if cluster is not None:
+            query_params['cluster'] = cluster
         if lang is not None:
-            query_params.update({'lang': lang})
+            query_params['lang'] = lang
         return self._get_data('current_weather_circle', params=query_params)
 
     def get_current_weather_group(self, city_ids):
@@ -493,13 +833,75 @@ class OpenWeatherMapClient():
         :param list city_ids: List of the city IDs to search. Limited to 20.
         :raises ValueError: When city_ids list is over 20.
         """
-        if len(city_ids) > 20:
-            exc = ValueError('The limit of locations is 20.')
+        if len(city_ids) > _GROUP_MAX_CITIES:
+            exc = ValueError(
+                f'The limit of locations is {_GROUP_MAX_CITIES}.')
             logger.warning(str(exc))
             raise exc
-        query_params = {'id': ','.join([str(cur_id) for cur_id in city_ids])}
+        query_params = {'id': ','.join(map(str, city_ids))}
         return self._get_data('current_weather_group', params=query_params)
 
+    def load_current_weather(self, city_id):
+        """Schedule the retrieval of current weather for a city ID.
+
+        Scheduled city IDs are retrieved by groups of 20, with as few API
+        requests as possible (see get_current_weather_group), when flush
+        method is called.
+
+        :param int city_id: The city ID to search.
+        :returns concurrent.futures.Future:
+            Future of city's current weather data, done once flushed.
+        """
+        future = Future()
+        self._pending_loads.setdefault(int(city_id), []).append(future)
+        return future
+
+    def flush(self):
+        """Retrieve current weather of every city ID scheduled with
+        load_current_weather, and set the result of their futures."""
+        pending_loads, self._pending_loads = self._pending_loads, {}
+        for city_ids in self._split_city_ids(pending_loads):
+            try:
+                result_data = self.get_current_weather_group(city_ids)
+            except Exception as exc:
+                # error is raised again by each future
+                self._resolve_loads(pending_loads, city_ids, exc=exc)
+            else:
+                self._resolve_loads(pending_loads, city_ids, result_data)
+
+    @staticmethod
+    def _split_city_ids(pending_loads):
+        """Return lists of scheduled city IDs, by groups of 20."""
+        city_ids = list(pending_loads)
+        return [
+            city_ids[idx:idx + _GROUP_MAX_CITIES]
+            for idx in range(0, len(city_ids), _GROUP_MAX_CITIES)]
+
+    @staticmethod
+    def _resolve_loads(pending_loads, city_ids, result_data=None, exc=None):
+        """Set the result (or exception) of city IDs futures, from the
+        data of a group of cities."""
+        city_datas = {}
+        if exc is None:
+            city_datas = {
+                city_data.get('city_id'): city_data
+                for city_data in result_data.get('datas', [])}
+        for city_id in city_ids:
+            city_data = city_datas.get(city_id)
+            for future in pending_loads[city_id]:
+                if future.done():
+                    # cancelled while waiting
+                    continue
+                if exc is not None:
+                    future.set_exception(exc)
+                elif city_data is not None:
+                    future.set_result(city_data)
+                    # every load of a city ID gets its own result
+                    city_data = copy.deepcopy(city_data)
+                else:
+                    future.set_exception(OpenWeatherMapClientError(
+                        f'No current weather data for city ID {city_id}'))
+
     def get_air_pollution_carbon_monoxyde(
             self, latitude, longitude, *, datetime='current'):
         """Retrieve Carbon Monoxide index.
@@ -539,7 +941,7 @@ class OpenWeatherMapClient():
         :param str datetime: (optional, default 'current')
             ISO 8601 date (UTC time) or alias ('current').
         """
-        extra_uri = '{},{}/{}.json'.format(latitude, longitude, datetime)
+        extra_uri = f'{latitude},{longitude}/{datetime}.json'
         return self._get_data(
             'air_pollution_carbon_monoxyde', extra_uri=extra_uri)
 
@@ -555,7 +957,7 @@ class OpenWeatherMapClient():
         :param str datetime: (optional, default 'current')
             ISO 8601 date (UTC time) or alias ('current').
         """
-        extra_uri = '{},{}/{}.json'.format(latitude, longitude, datetime)
+        extra_uri = f'{latitude},{longitude}/{datetime}.json'
         return self._get_data('air_pollution_ozone', extra_uri=extra_uri)
 
     def get_air_pollution_sulfur_dioxide(
@@ -570,7 +972,7 @@ class OpenWeatherMapClient():
         :param str datetime: (optional, default 'current')
             ISO 8601 date (UTC time) or alias ('current').
         """
-        extra_uri = '{},{}/{}.json'.format(latitude, longitude, datetime)
+        extra_uri = f'{latitude},{longitude}/{datetime}.json'
         return self._get_data(
             'air_pollution_sulfur_dioxide', extra_uri=extra_uri)
 
@@ -586,7 +988,7 @@ class OpenWeatherMapClient():
         :param str datetime: (optional, default 'current')
             ISO 8601 date (UTC time) or alias ('current').
         """
-        extra_uri = '{},{}/{}.json'.format(latitude, longitude, datetime)
+        extra_uri = f'{latitude},{longitude}/{datetime}.json'
         return self._get_data(
             'air_pollution_nitrogen_dioxide', extra_uri=extra_uri)
 
@@ -597,9 +999,7 @@ class OpenWeatherMapClient():
         :param float longitude: Longitude coordinate of location.
         """
         # uv index API requires a specific order for query parameters...
-        query_params = OrderedDict()
-        query_params['lat'] = latitude
-        query_params['lon'] = longitude
+        query_params = {'lat': latitude, 'lon': longitude}
         return self._get_data(
             'uv_index_current', params=query_params, with_units=False)
 
@@ -610,9 +1010,7 @@ class OpenWeatherMapClient():
         :param float longitude: Longitude coordinate of location.
         """
         # uv index API requires a specific order for query parameters...
-        query_params = OrderedDict()
-        query_params['lat'] = latitude
-        query_params['lon'] = longitude
+        query_params = {'lat': latitude, 'lon': longitude}
         return self._get_data(
             'uv_index_forecast', params=query_params, with_units=False)
 
@@ -625,10 +1023,8 @@ class OpenWeatherMapClient():
         :param datetime dt_end: Final point of time period.
         """
         # uv index API requires a specific order for query parameters...
-        query_params = OrderedDict()
-        query_params['lat'] = latitude
-        query_params['lon'] = longitude
-        query_params['start'] = dt_start.timestamp()
-        query_params['end'] = dt_end.timestamp()
+        query_params = {
+            'lat': latitude, 'lon': longitude,
+            'start': dt_start.timestamp(), 'end': dt_end.timestamp()}
         return self._get_data(
             'uv_index_historical', params=query_params, with_units=False)
@@ -0,0 +1,304 @@
+"""An asyncio client for Open Weather Map API, based on aiohttp.
+
+aiohttp is an optional dependency: pip install openweathermap-client[async]
+"""
+
+import asyncio
+import logging
+import zlib
+
+import aiohttp
+
+from . import _LOGGER_NAME
+from .api_client import (
+    OpenWeatherMapClient, json_loads,
+    _DEFAULT_BACKOFF_FACTOR, _RETRY_STATUS_CODES)
+from .exceptions import (
+    OpenWeatherMapClientError, OWMClientAccessLimitationError)
+
+
+_DEFAULT_CONNECTION_LIMIT = 20
+_DEFAULT_KEEPALIVE_TIMEOUT = 85
+# delay while city IDs to load are collected before sending group requests
+_DEFAULT_LOAD_DELAY = 0.005
+
+
+logger = logging.getLogger(_LOGGER_NAME)
+
+
+class AsyncOpenWeatherMapClient(OpenWeatherMapClient):
+    """OpenWeatherMap API asyncio client class.
+
+    Same API as OpenWeatherMapClient, except that every get_* method returns
+    an awaitable. This allows to send many API calls concurrently::
+
+        async with AsyncOpenWeatherMapClient(api_key) as client:
+            result_datas = await asyncio.gather(*[
+                client.get_current_weather_by_city_id(city_id)
+                for city_id in city_ids])
+
+    ..Note:
+        Parameters are still checked when get_* methods are called, so a
+        ValueError is raised before anything is awaited.
+    """
+
+    def __init__(self, api_key, **kwargs):
+        """
+        cf. OpenWeatherMapClient
+        """
+        super().__init__(api_key, **kwargs)
+        self._timeout = self._client_timeout(self.timeout)
+        self._flush_handle = None
+        # running flush tasks (the event loop only keeps weak references)
+        self._flush_tasks = set()
+
+    def _create_session(self):
+        # aiohttp session has to be created within a running event loop
+        return None
+
+    def _set_session_retries(self):
+        # retries are counted by _get, reading max_retries on each call
+        pass
+
+    @staticmethod
+    def _client_timeout(timeout):
+        """Convert a requests like timeout into an aiohttp one."""
+        if timeout is None:
+            return aiohttp.ClientTimeout(total=None)
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+        else:
+            connect_timeout = read_timeout = timeout
+        return aiohttp.ClientTimeout(
+            total=None, sock_connect=connect_timeout, sock_read=read_timeout)
+
+    def _get_session(self):
+        """Return the HTTP session, created on first call."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=_DEFAULT_CONNECTION_LIMIT,
+                    keepalive_timeout=_DEFAULT_KEEPALIVE_TIMEOUT))
+        return self._session
+
+    def __enter__(self):
+        raise TypeError('Use "async with" instead.')
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Close the HTTP session and release its pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+
+    async def _get(self, uri, **kwargs):
+        """Send a GET request, using max retries if call failed.
+
+        ..Note:
+            Retries are counted for each request, as requests may be sent
+            concurrently. last_uri_call and last_uri_call_tries are only set
+            when the request ends, by the last request to end.
+
+        :returns aiohttp.ClientResponse:
+        :raises OpenWeatherMapClientError:
+            When a request connection error or timeout is thrown.
+        :raises OWMClientAccessLimitationError:
+            When the OpenWeatherMap's limit of calls per minute is reached.
+        :raises aiohttp.ClientResponseError:
+            When response status code is not OK (and max retries reached).
+        """
+        params = kwargs.get('params', {})
+        session = self._get_session()
+        tries = 0
+        try:
+            while True:
+                tries += 1
+                is_last_try = tries > self.max_retries
+                try:
+                    # send request and receive response
+                    response = await session.get(
+                        uri, timeout=self._timeout, **kwargs)
+                except (aiohttp.ClientConnectionError,
+                        asyncio.TimeoutError,) as src_exc:
+                    if is_last_try:
+                        exc = OpenWeatherMapClientError(str(src_exc))
+                        logger.error(
+                            'GET %s: %s', self._readable_uri(uri, params), exc)
+                        raise exc
+                    logger.warning(
+                        '%i/%i GET %s: %s', tries, self.max_retries,
+                        self._readable_uri(uri, params), src_exc)
+                else:
+                    if (response.status not in _RETRY_STATUS_CODES or
+                            is_last_try):
+                        break
+                    response.release()
+
+                # exponential backoff (same as urllib3 Retry used by sync
+                # client)
+                if tries > 1:
+                    await asyncio.sleep(
+                        _DEFAULT_BACKOFF_FACTOR * 2 ** (tries - 1))
+        finally:
+            # best-effort information, shared by concurrent requests
+            self._set_last_uri_call(uri, params)
+            self.last_uri_call_tries = tries
+
+        # is response a bad gateway (502) code ?
+        if response.status == 502:
+            response.release()
+            limit_exc = OWMClientAccessLimitationError(
+                'For example, OpenWeatherMap free edition only'
+                'allows 60 API calls per minute!')
+            logger.error(
+                'GET %s: %s', self._readable_uri(uri, params), limit_exc)
+            raise limit_exc
+        if response.status >= 400:
+            response.release()
+        response.raise_for_status()
+
+        return response
+
+    async def _get_data(self, service_name, *, extra_uri=None, params=None,
+                        with_units=True):
+        """Send GET request to retrieve data from a service.
+
+        cf. OpenWeatherMapClient._get_data
+        """
+        # get service information (uri, schema, ...)
+        service_info = self._get_service_info(service_name)
+
+        # build uri and prepare query parameters
+        uri = self._build_uri(service_name, extra_uri)
+        query_params = self._build_query_params(params, with_units)
+
+        # recently retrieved data ? (raw JSON data is cached and loaded
+        # again, so that callers never share a mutable result)
+        cache_key = self._build_cache_key(service_name, extra_uri, params)
+        resp_data = None
+        if cache_key is not None:
+            resp_data = self._cache.get(cache_key)
+        is_cached = resp_data is not None
+
+        if not is_cached:
+            # send request and receive response
+            response = await self._get(uri, params=query_params)
+            resp_data = json_loads(await response.read())
+
+        result = self._load_response_data(
+            service_info, resp_data, uri, query_params)
+        if cache_key is not None and not is_cached:
+            self._cache[cache_key] = resp_data
+        return result
+
+    async def get_city_list(self, *, validate_with_schema=True):
+        """Retrieve all cities information, including cities' IDs list.
+
+        cf. OpenWeatherMapClient.get_city_list
+        """
+        # get service information (uri, schema, ...)
+        service_info = self._AVAILABLE_SERVICES['city_list']
+
+        # do not block the event loop while reading, loading and
+        # deserializing (large) data
+        loop = asyncio.get_running_loop()
+        validators = await loop.run_in_executor(
+            None, self._read_city_list_validators)
+
+        # send request and receive response
+        response = await self._get(
+            self._service_uris['city_list'],
+            headers=self._city_list_request_headers(validators))
+
+        if response.status == 304:
+            response.release()
+            json_data = await loop.run_in_executor(
+                None, self._read_city_list_data)
+        else:
+            # decompress response body as it is downloaded
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            json_chunks = []
+            async for chunk in response.content.iter_any():
+                json_chunks.append(decompressor.decompress(chunk))
+            json_chunks.append(decompressor.flush())
+            json_bytes = b''.join(json_chunks)
+            await loop.run_in_executor(
+                None, self._write_city_list_cache, response.headers,
+                json_bytes)
+            json_data = await loop.run_in_executor(
+                None, json_loads, json_bytes)
+
+        if not validate_with_schema:
+            return json_data
+
+        return await loop.run_in_executor(
+            None, self._deserialize_with_schema, service_info['schema'],
+            json_data)
+
+    async def iter_city_list(self):
+        """Iterate over all cities information, as raw JSON data.
+
+        ..Note:
+            Unlike OpenWeatherMapClient, the whole list is loaded first.
+
+        cf. OpenWeatherMapClient.iter_city_list
+        """
+        for city in await self.get_city_list(validate_with_schema=False):
+            yield city
+
+    async def city_id_index(self):
+        """Return all cities information (raw JSON data) by city ID.
+
+        cf. OpenWeatherMapClient.city_id_index
+        """
+        return {city['id']: city async for city in self.iter_city_list()}
+
+    async def load_current_weather(self, city_id):
+        """Retrieve current weather for a city ID.
+
+        City IDs requested within a few milliseconds are retrieved together,
+        by groups of 20, with as few API requests as possible (see
+        get_current_weather_group)::
+
+            result_datas = await asyncio.gather(*[
+                client.load_current_weather(city_id)
+                for city_id in city_ids])
+
+        :param int city_id: The city ID to search.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending_loads.setdefault(int(city_id), []).append(future)
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(
+                _DEFAULT_LOAD_DELAY, self._start_flush)
+        return await future
+
+    def _start_flush(self):
+        # keep a reference on the task until done, as the event loop does not
+        flush_task = asyncio.ensure_future(self.flush())
+        self._flush_tasks.add(flush_task)
+        flush_task.add_done_callback(self._flush_tasks.discard)
+
+    async def flush(self):
+        """Retrieve current weather of every city ID pending in
+        load_current_weather, without waiting for the collect delay."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending_loads, self._pending_loads = self._pending_loads, {}
+        groups = self._split_city_ids(pending_loads)
+        result_datas = await asyncio.gather(
+            *[self.get_current_weather_group(city_ids)
+              for city_ids in groups],
+            return_exceptions=True)
+        for city_ids, result_data in zip(groups, result_datas):
+            if isinstance(result_data, BaseException):
+                # error is raised again by each awaiting call
+                self._resolve_loads(pending_loads, city_ids, exc=result_data)
+            else:
+                self._resolve_loads(pending_loads, city_ids, result_data)
@@ -1,18 +1,249 @@
 """OpenWeatherMap API response schemas."""
 
 import datetime as dt
+from functools import lru_cache
+import re
 import marshmallow as ma
 
-from .utils import dt_from_timestamp
-
-
-class CityCoordSchema(ma.Schema):
+try:
+    # optional: JIT compiled (de)serialization, see lyft/toastedmarshmallow
+    from toastedmarshmallow import Jit
+except ImportError:
+    Jit = None
+
+# RFC 3339 datetimes (strict ISO 8601): full datetime with timezone
+_RFC3339_RE = re.compile(
+    r'(\d{4}-\d\d-\d\d)[Tt ](\d\d:\d\d:\d\d)(?:\.(\d+))?'
+    r'([Zz]|[+-]\d\d:\d\d)\Z')
+
+
+def _parse_rfc3339(value):
+    """Parse a RFC 3339 datetime (same format as ciso8601.parse_rfc3339)."""
+    match = _RFC3339_RE.match(value)
+    if match is None:
+        raise ValueError(f'Invalid RFC 3339 datetime: {value}')
+    date, time, fraction, offset = match.groups()
+    # before Python 3.11, datetime.fromisoformat rejects 'Z' and fractions
+    # which are not 3 or 6 digits long: use microseconds (6 digits)
+    if fraction is not None:
+        time = f'{time}.{fraction[:6]:0<6}'
+    if offset in ('Z', 'z'):
+        offset = '+00:00'
+    return dt.datetime.fromisoformat(f'{date}T{time}{offset}')
+
+
+try:
+    # optional: C coded RFC 3339 datetimes parser
+    from ciso8601 import parse_rfc3339 as _parse_iso
+except ImportError:
+    _parse_iso = _parse_rfc3339
+
+_UTC = dt.timezone.utc
+_from_ts = dt.datetime.fromtimestamp
+
+
+@lru_cache(maxsize=4096)
+def _from_ts_utc(timestamp):
+    # same timestamps come again and again (forecast 3 hours steps, cities of
+    # a group...), and datetimes are immutable: share them
+    return _from_ts(timestamp, _UTC)
+
+
+class TimestampUTCField(ma.fields.Field):
+    """UNIX timestamp field, deserialized as an UTC datetime."""
+    default_error_messages = {
+        'invalid': 'Not a valid timestamp.',
+    }
+
+    def _deserialize(self, value, attr, data):
+        try:
+            return _from_ts_utc(value)
+        except (TypeError, ValueError, OverflowError, OSError):
+            self.fail('invalid')
+
+
+class ISO8601DateTimeField(ma.fields.Field):
+    """ISO 8601 datetime field, as formatted by OpenWeatherMap API."""
+    default_error_messages = {
+        'invalid': 'Not a valid ISO 8601 datetime.',
+    }
+
+    def _deserialize(self, value, attr, data):
+        try:
+            return _parse_iso(value)
+        except (TypeError, ValueError):
+            self.fail('invalid')
+
+
+def _nested_loader(field):
+    """Return the generated loader of a nested field's schema, or None."""
+    if type(field) is not ma.fields.Nested or field.validators:
+        return None
+    return getattr(field.schema, '_fast_load', None)
+
+
+# fields deserialized in line by generated loaders, when without validators:
+# same conversion as marshmallow when valid (raising otherwise), skipped for
+# values already of the right type (most of JSON numbers)
+_INLINE_NUMBER_FIELDS = {
+    ma.fields.Float: 'float',
+    ma.fields.Integer: 'int',
+}
+
+
+def _load_plan(schema):
+    """Return the load plan of a schema, or None when the schema can not be
+    loaded by a generated function (processors, required fields...).
+
+    The plan is a tuple of (attr_name, load_from, key, field) for each field
+    to load, computed once from the bound fields of the schema.
+    """
+    if (schema.__processors__ or schema.__error_handler__ or
+            schema.dict_class is not dict or schema.partial):
+        return None
+    plan = []
+    for attr_name, field in schema.fields.items():
+        if field.dump_only:
+            continue
+        key = field.attribute or attr_name
+        if field.required or field.missing is not ma.missing or '.' in key:
+            return None
+        plan.append((attr_name, field.load_from, key, field))
+    return tuple(plan)
+
+
+def _compile_loader(schema, plan):
+    """Return a function loading data as schema.load does, specialized on
+    the load plan of the schema (see _load_plan).
+
+    The field names and keys are hard-coded in a single generated function,
+    which converts numbers and checks strings in line, directly calls the
+    loaders of nested schemas (in a loop for lists of nested data), and
+    calls the deserialize method of any other field (bound to a local
+    variable). It raises on any data which would not be loaded without
+    validation error: schema.load then falls back on marshmallow, which
+    reports these errors.
+    """
+    namespace = {'missing': ma.missing}
+    lines = [
+        'def load(data):',
+        '    if data.__class__ is not dict:',
+        '        raise TypeError(data)',
+        '    get = data.get',
+        '    ret = {}',
+    ]
+    for idx, (attr_name, load_from, key, field) in enumerate(plan):
+        check_lines = []
+        nested_load = _nested_loader(field)
+        items_load = None
+        if type(field) is ma.fields.List and not field.validators:
+            items_load = _nested_loader(field.container)
+        if type(field) in _INLINE_NUMBER_FIELDS and not field.validators:
+            num_type = _INLINE_NUMBER_FIELDS[type(field)]
+            load_expr = (
+                f'value if value.__class__ is {num_type} '
+                f'else {num_type}(value)')
+        elif type(field) is ma.fields.String and not field.validators:
+            check_lines = [
+                '        if value.__class__ is not str:',
+                '            raise TypeError(value)',
+            ]
+            load_expr = 'value'
+        elif nested_load is not None:
+            # nested data is loaded in line, without schema.load overhead
+            namespace[f'load_{idx}'] = nested_load
+            load_expr = f'load_{idx}(value)'
+        elif items_load is not None:
+            # lists of nested data are loaded in a single loop
+            namespace[f'load_{idx}'] = items_load
+            check_lines = [
+                '        if value.__class__ is not list:',
+                '            raise TypeError(value)',
+            ]
+            load_expr = f'[load_{idx}(item) for item in value]'
+        else:
+            namespace[f'deserialize_{idx}'] = field.deserialize
+            load_expr = (
+                f'deserialize_{idx}(value, {load_from or attr_name!r}, data)')
+        lines.append(f'    value = get({attr_name!r}, missing)')
+        if load_from:
+            lines.extend([
+                '    if value is missing:',
+                f'        value = get({load_from!r}, missing)',
+            ])
+        lines.append('    if value is not missing:')
+        lines.extend(check_lines)
+        lines.append(f'        ret[{key!r}] = {load_expr}')
+    lines.append('    return ret')
+    if schema.many:
+        lines.extend([
+            'def load_many(data):',
+            '    if data.__class__ is not list:',
+            '        raise TypeError(data)',
+            '    return [load(item) for item in data]',
+        ])
+
+    code = compile(
+        '\n'.join(lines), f'<fast_load:{schema.__class__.__name__}>', 'exec')
+    exec(code, namespace)
+    return namespace['load_many' if schema.many else 'load']
+
+
+class BaseSchema(ma.Schema):
+    """Base schema, JIT compiled when toastedmarshmallow is installed.
+
+    Otherwise, data is loaded by a function generated for each schema
+    instance (see _compile_loader), unless `fast_load = False` is set in
+    schema's Meta options.
+    """
+    class Meta():
+        jit = Jit
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._load_plan = _load_plan(self)
+        self._fast_load = None
+        if (self._load_plan is not None and
+                getattr(self.Meta, 'fast_load', True)):
+            self._fast_load = _compile_loader(self, self._load_plan)
+
+    def load(self, data, many=None, partial=None):
+        if (self._fast_load is not None and many is None and
+                partial is None and getattr(self, 'jit', None) is None):
+            try:
+                return ma.UnmarshalResult(self._fast_load(data), {})
+            except Exception:
+                # invalid data: let marshmallow report validation errors
+                pass
+        return super().load(data, many=many, partial=partial)
+
+
+class NoJitSchema(BaseSchema):
+    """Base schema never JIT compiled.
+
+    toastedmarshmallow fails to compile fields loaded from keys which are not
+    valid Python identifiers (such as '3h').
+    """
+    class Meta(BaseSchema.Meta):
+        jit = None
+
+    @property
+    def jit(self):
+        return None
+
+    @jit.setter
+    def jit(self, value):
+        # nested schemas inherit the JIT of their parent: ignore it
+        pass
+
+
+class CityCoordSchema(BaseSchema):
     """City geographical coordinates schema."""
     latitude = ma.fields.Float(load_from='lat')
     longitude = ma.fields.Float(load_from='lon')
 
 
-class CitySchema(ma.Schema):
+class CitySchema(BaseSchema):
     """City schema."""
     id = ma.fields.Integer()
     name = ma.fields.String()
@@ -20,27 +251,27 @@ class CitySchema(ma.Schema):
     coord = ma.fields.Nested(CityCoordSchema)
 
 
-class MainDataSchema(ma.Schema):
+class MainDataSchema(BaseSchema):
     """Main weather data schema."""
-    class Meta():
+    class Meta(BaseSchema.Meta):
         exclude = ('temp_kf',)
     temp = ma.fields.Float()  # temperature, °C (if units=metric)
     temp_min = ma.fields.Float()  # minimum temperature, °C
     temp_max = ma.fields.Float()  # maximum temperature, °C
-    humidity = ma.fields.Float()  # humidity, %
+    humidity = ma.fields.Integer()  # humidity, %
     pressure = ma.fields.Float()  # atmospheric pressure at sea level, hPa
     sea_level = ma.fields.Float()  # atmospheric pressure at sea level, hPa
     grnd_level = ma.fields.Float()  # atmospheric pressure at ground level, hPa
 
 
-class WindDataSchema(ma.Schema):
+class WindDataSchema(BaseSchema):
     """Wind data schema."""
     direction = ma.fields.Float(load_from='deg')  # wind direction, degrees
     speed = ma.fields.Float()  # wind speed, meter/sec
     gust = ma.fields.Float()  # wind gust, meter/sec
 
 
-class WeatherDataSchema(ma.Schema):
+class WeatherDataSchema(BaseSchema):
     """Weather data schema."""
     id = ma.fields.Integer()  # weather condition id
     main = ma.fields.String()  # groud of weather parameters (rain, snow, ...)
@@ -48,28 +279,28 @@ class WeatherDataSchema(ma.Schema):
     icon = ma.fields.String()  # weather icon id
 
 
-class CloudDataSchema(ma.Schema):
+class CloudDataSchema(BaseSchema):
     """Cloud data schema."""
     clouds_all = ma.fields.Integer(load_from='all')  # cloudiness percentage, %
 
 
-class RainDataSchema(ma.Schema):
+class RainDataSchema(NoJitSchema):
     """Rain data schema."""
     rain_3h = ma.fields.Float(
         load_from='3h'
     )  # rain volume for the last 3 hours, mm
 
 
-class SnowDataSchema(ma.Schema):
+class SnowDataSchema(NoJitSchema):
     """Snow data schema."""
     snow_3h = ma.fields.Float(
         load_from='3h'
     )  # snow volume for the last 3 hours, mm
 
 
-class ForecastDataSchema(ma.Schema):
+class ForecastDataSchema(BaseSchema):
     """Forecast data schema."""
-    dt_value = ma.fields.Method(load_from='dt', deserialize='_from_ts')  # UTC
+    dt_value = TimestampUTCField(load_from='dt')  # UTC
     dt_timestamp = ma.fields.Integer(load_from='dt')  # original UNIX timestamp
     dt_txt = ma.fields.String()
     main = ma.fields.Nested(MainDataSchema)
@@ -81,12 +312,8 @@ class ForecastDataSchema(ma.Schema):
     rain = ma.fields.Nested(RainDataSchema)
     snow = ma.fields.Nested(SnowDataSchema)
 
-    @staticmethod
-    def _from_ts(timestamp):
-        return dt_from_timestamp(timestamp, ts_tz=dt.timezone.utc)
-
 
-class ForecastSchema(ma.Schema):
+class ForecastSchema(BaseSchema):
     """Forecast response schema."""
     city = ma.fields.Nested(CitySchema)
     cnt = ma.fields.Integer()
@@ -96,20 +323,16 @@ class ForecastSchema(ma.Schema):
     )
 
 
-class CurrentWeatherSysDataSchema(ma.Schema):
+class CurrentWeatherSysDataSchema(BaseSchema):
     """Current weather sys data schema."""
     country = ma.fields.String()
-    sunrise = ma.fields.Method(deserialize='_from_ts')  # UTC
-    sunset = ma.fields.Method(deserialize='_from_ts')  # UTC
+    sunrise = TimestampUTCField()  # UTC
+    sunset = TimestampUTCField()  # UTC
     sunrise_timestamp = ma.fields.Integer(load_from='sunrise')
     sunset_timestamp = ma.fields.Integer(load_from='sunset')
 
-    @staticmethod
-    def _from_ts(timestamp):
-        return dt_from_timestamp(timestamp, ts_tz=dt.timezone.utc)
-
 
-class CurrentWeatherSchema(ma.Schema):
+class CurrentWeatherSchema(BaseSchema):
     """Current weather response schema."""
     city_id = ma.fields.Integer(load_from='id')
     city_name = ma.fields.String(load_from='name')
@@ -117,7 +340,7 @@ class CurrentWeatherSchema(ma.Schema):
         CityCoordSchema,
         load_from='coord'
     )
-    dt_value = ma.fields.Method(load_from='dt', deserialize='_from_ts')  # UTC
+    dt_value = TimestampUTCField(load_from='dt')  # UTC
     dt_timestamp = ma.fields.Integer(load_from='dt')  # original UNIX timestamp
     main = ma.fields.Nested(MainDataSchema)
     weather = ma.fields.List(
@@ -130,12 +353,8 @@ class CurrentWeatherSchema(ma.Schema):
     snow = ma.fields.Nested(SnowDataSchema)
     sys = ma.fields.Nested(CurrentWeatherSysDataSchema)
 
-    @staticmethod
-    def _from_ts(timestamp):
-        return dt_from_timestamp(timestamp, ts_tz=dt.timezone.utc)
 
-
-class CurrentWeatherSearchSchema(ma.Schema):
+class CurrentWeatherSearchSchema(BaseSchema):
     """Current weather response schema for within box, within circle
     and search for IDs."""
     status_code = ma.fields.Integer(load_from='cod')
@@ -147,40 +366,32 @@ class CurrentWeatherSearchSchema(ma.Schema):
     )
 
 
-class UVIndexSchema(ma.Schema):
+class UVIndexSchema(BaseSchema):
     """Current UV index response schema."""
     latitude = ma.fields.Float(load_from='lat')
     longitude = ma.fields.Float(load_from='lon')
-    date = ma.fields.DateTime(
-        load_from='date_iso', deserialize='_from_iso8601')
+    # 'date' key is the timestamp of 'date_iso' datetime
+    date = TimestampUTCField()
     date_iso = ma.fields.String()  # original ISO 8601 datetime
     dt_timestamp = ma.fields.Integer(load_from='date')  # timestamp ISO 8601
     value = ma.fields.Float()  # UV index
 
-    @staticmethod
-    def _from_iso8601(date):
-        return ma.utils.from_iso_datetime(date)
-
 
-class AirPollutionLocationSchema(ma.Schema):
+class AirPollutionLocationSchema(BaseSchema):
     """Air pollution location data schema."""
     latitude = ma.fields.Float()
     longitude = ma.fields.Float()
 
 
-class AirPollutionBaseSchema(ma.Schema):
+class AirPollutionBaseSchema(BaseSchema):
     """Air pollution base response schema."""
-    time = ma.fields.DateTime(deserialize='_from_iso8601')
+    time = ISO8601DateTimeField()
     # original ISO 8601 timestamp
     time_iso8601 = ma.fields.String(load_from='time')
     location = ma.fields.Nested(AirPollutionLocationSchema)
 
-    @staticmethod
-    def _from_iso8601(time):
-        return ma.utils.from_iso_datetime(time)
-
 
-class AirPollutionCarbonMonoxydeDataSchema(ma.Schema):
+class AirPollutionCarbonMonoxydeDataSchema(BaseSchema):
     """Air pollution carbon monoxyde data schema."""
     precision = ma.fields.Float()  # measurement precision
     pressure = ma.fields.Float()  # atmospheric pressure, hPa
@@ -200,7 +411,7 @@ class AirPollutionOzoneSchema(AirPollutionBaseSchema):
     data = ma.fields.Float()  # ozone layer thickness, DU (Dobson Unit)
 
 
-class AirPollutionSulfurDioxideDataSchema(ma.Schema):
+class AirPollutionSulfurDioxideDataSchema(BaseSchema):
     """Air pollution sulfur dioxide data schema."""
     precision = ma.fields.Float()  # measurement precision
     pressure = ma.fields.Float()  # atmospheric pressure, hPa
@@ -215,13 +426,13 @@ class AirPollutionSulfurDioxideSchema(AirPollutionBaseSchema):
     )
 
 
-class AirPollutionNitrogenDioxideItemDataSchema(ma.Schema):
+class AirPollutionNitrogenDioxideItemDataSchema(BaseSchema):
     """Air pollution nitrogen dioxide item data schema."""
     precision = ma.fields.Float()  # measurement precision
     value = ma.fields.Float()  # nitrogen dioxide volume mixing ratio
 
 
-class AirPollutionNitrogenDioxideItemSchema(ma.Schema):
+class AirPollutionNitrogenDioxideItemSchema(BaseSchema):
     """Air pollution nitrogen dioxide item schema."""
     no2 = ma.fields.Nested(AirPollutionNitrogenDioxideItemDataSchema)
     no2_strat = ma.fields.Nested(AirPollutionNitrogenDioxideItemDataSchema)
@@ -231,3 +442,17 @@ class AirPollutionNitrogenDioxideItemSchema(ma.Schema):
 class AirPollutionNitrogenDioxideSchema(AirPollutionBaseSchema):
     """Air pollution nitrogen dioxide response schema."""
     data = ma.fields.Nested(AirPollutionNitrogenDioxideItemSchema)
+
+
+# Schema instances shared by every client: loading data does not change a
+# schema, so fields (and nested schemas) are only initialized once.
+CITY_LIST_SCHEMA = CitySchema(many=True)
+FORECAST_SCHEMA = ForecastSchema()
+CURRENT_WEATHER_SCHEMA = CurrentWeatherSchema()
+CURRENT_WEATHER_SEARCH_SCHEMA = CurrentWeatherSearchSchema()
+AIR_POLLUTION_CARBON_MONOXYDE_SCHEMA = AirPollutionCarbonMonoxydeSchema()
+AIR_POLLUTION_OZONE_SCHEMA = AirPollutionOzoneSchema()
+AIR_POLLUTION_SULFUR_DIOXIDE_SCHEMA = AirPollutionSulfurDioxideSchema()
+AIR_POLLUTION_NITROGEN_DIOXIDE_SCHEMA = AirPollutionNitrogenDioxideSchema()
+UV_INDEX_SCHEMA = UVIndexSchema()
+UV_INDEX_LIST_SCHEMA = UVIndexSchema(many=True)
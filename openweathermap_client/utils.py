@@ -3,12 +3,19 @@
 import datetime as dt
 
 
+UTC = dt.timezone.utc
+
+_fromtimestamp = dt.datetime.fromtimestamp
+
+
 def dt_from_timestamp(timestamp, *, ts_tz=None):
     """Return a datetime converted from a timestamp value.
 
     :param float timestamp: Timestamp value to convert.
     :param datetime.timezone ts_tz: (optional, default None)
-        Must the datetime result be timezone aware?
+        Must the datetime result be timezone aware? (see UTC)
     :returns datetime: The converted timestamp in datetime object.
     """
-    return dt.datetime.fromtimestamp(timestamp, tz=ts_tz)
+    if ts_tz is None:
+        return _fromtimestamp(timestamp)
+    return _fromtimestamp(timestamp, ts_tz)
@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 
+import os
+
 from setuptools import setup, find_packages
 
 
@@ -7,6 +9,15 @@ from setuptools import setup, find_packages
 with open('README.rst', encoding='utf-8') as f:
     long_description = f.read()
 
+# Optionally compile schemas and utils modules to C extensions, to build
+# binary wheels: OPENWEATHERMAP_CLIENT_CYTHONIZE=1 pip wheel .
+ext_modules = []
+if os.environ.get('OPENWEATHERMAP_CLIENT_CYTHONIZE'):
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        ['openweathermap_client/schemas.py', 'openweathermap_client/utils.py'],
+        compiler_directives={'language_level': 3})
+
 setup(
     name='openweathermap-client',
 
@@ -39,11 +50,11 @@ setup(
         'Topic :: Database',
         'Topic :: Internet :: WWW/HTTP',
         'License :: OSI Approved :: MIT License',
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5',
-        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3.7',
     ],
 
+    python_requires='>=3.7',
+
 
     # What does your project relate to?
     keywords='open weather map api client',
@@ -52,6 +63,7 @@ setup(
     # simple. Or you can use find_packages().
     # packages=find_packages(exclude=['contrib', 'docs', 'tests']),
     packages=find_packages(exclude=['tests*']),
+    ext_modules=ext_modules,
 
     # List run-time dependencies here. These will be installed by pip when
     # your project is installed. For an analysis of "install_requires" vs pip's
@@ -60,6 +72,7 @@ setup(
     # https://caremad.io/2013/07/setup-vs-requirement/
     install_requires=[
         'requests>=2.18',
+        'cachetools>=2.0',
         'marshmallow>=2.15.2,<3.0.0',
     ],
 
@@ -68,6 +81,19 @@ setup(
     # for example:
     # $ pip install -e .[dev,test]
     extras_require={
+        'async': [
+            'aiohttp>=3.3',
+        ],
+        'jit': [
+            'toastedmarshmallow>=2.15.2',
+        ],
+        'speedups': [
+            'orjson',
+            'isal',
+            'brotli',
+            'ijson>=3.1',
+            'ciso8601',
+        ],
         'test': [
             'pytest>=2.8',
             'pytest-cov>=2.4.0',
@@ -3,14 +3,14 @@
 import pytest
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def apihost(request):
     """Return an api_host for OpenWeatherMap API."""
     # samples api host
     return 'samples.openweathermap.org'
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def apikey(request):
     """Return an api_key for OpenWeatherMap API."""
     # available free api keys :
@@ -19,7 +19,7 @@ def apikey(request):
     return 'ae0c16c7a7c591f9d88e50954c9b2c0b'
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def city_info(request):
     """Return an OpenWeatherMap API city location."""
     return {
@@ -34,7 +34,7 @@ def city_info(request):
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def city_ids(request):
     """Return a list of OpenWeatherMap API city ID."""
     return (6434841, 2992790,)
@@ -0,0 +1,82 @@
+"""Tests for AsyncOpenWeatherMapClient."""
+
+import asyncio
+
+import pytest
+
+aiohttp = pytest.importorskip('aiohttp')
+
+from openweathermap_client.async_client import (  # noqa: E402
+    AsyncOpenWeatherMapClient)
+
+
+class TestAsyncOpenWeatherMapClient():
+    """OpenWeatherMap asyncio api client tests."""
+
+    def test_async_openweathermap_client(self, apikey, apihost):
+        """Test asyncio api client init."""
+
+        client = AsyncOpenWeatherMapClient(apikey, host=apihost)
+        assert client.api_key == apikey
+        assert client._base_uri == 'https://{}'.format(apihost)
+        assert client._session is None
+        assert client._timeout.sock_connect == client.timeout
+        assert client._timeout.sock_read == client.timeout
+
+        client = AsyncOpenWeatherMapClient(apikey, timeout=(2, 5))
+        assert client._timeout.sock_connect == 2
+        assert client._timeout.sock_read == 5
+
+        with pytest.raises(TypeError):
+            with client:
+                pass
+
+    def test_async_openweathermap_client_load_current_weather(self, apikey):
+        """Test asyncio api client current weather loads by groups."""
+
+        async def fake_get_group(city_ids):
+            groups.append(city_ids)
+            return {'datas': [{'city_id': city_id} for city_id in city_ids]}
+
+        async def _load_current_weathers():
+            client = AsyncOpenWeatherMapClient(apikey)
+            client.get_current_weather_group = fake_get_group
+            result_datas = await asyncio.gather(*[
+                client.load_current_weather(city_id)
+                for city_id in [*range(1, 26), 3]])
+            # flush task references are released once done
+            await asyncio.sleep(0)
+            assert not client._flush_tasks
+            return result_datas
+
+        groups = []
+        loop = asyncio.new_event_loop()
+        try:
+            result_datas = loop.run_until_complete(_load_current_weathers())
+        finally:
+            loop.close()
+        assert [len(city_ids) for city_ids in groups] == [20, 5]
+        assert result_datas[0] == {'city_id': 1}
+        assert result_datas[-2] == {'city_id': 25}
+        # same city ID loaded twice: results are not shared
+        assert result_datas[-1] == {'city_id': 3}
+        assert result_datas[-1] is not result_datas[2]
+
+    def test_async_openweathermap_client_current_weather(
+            self, apikey, city_ids):
+        """Test asyncio api client get current weather concurrently."""
+
+        async def _get_current_weathers():
+            async with AsyncOpenWeatherMapClient(apikey) as client:
+                return await asyncio.gather(*[
+                    client.get_current_weather_by_city_id(city_id)
+                    for city_id in city_ids])
+
+        loop = asyncio.new_event_loop()
+        try:
+            result_datas = loop.run_until_complete(_get_current_weathers())
+        finally:
+            loop.close()
+        assert len(result_datas) == len(city_ids)
+        for result_data in result_datas:
+            assert result_data['main']['temp'] is not None
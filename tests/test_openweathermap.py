@@ -1,6 +1,8 @@
 """Tests for OpenWeatherMapClient."""
 
 import datetime as dt
+import gzip
+import io
 
 import pytest
 from tests.utils import isclose
@@ -8,7 +10,8 @@ from tests.utils import isclose
 from requests.exceptions import HTTPError as req_HTTPError
 
 from openweathermap_client import OpenWeatherMapClient
-from openweathermap_client.exceptions import OWMClientKeyNotDefinedError
+from openweathermap_client.exceptions import (
+    OpenWeatherMapClientError, OWMClientKeyNotDefinedError)
 from openweathermap_client.api_client import (
     _API_HOST, _DEFAULT_MAX_RETRIES, _DEFAULT_UNITS)
 
@@ -26,6 +29,10 @@ class TestOpenWeatherMapClient():
         assert client._base_uri == 'https://{}'.format(apihost)
         assert client._base_uri_params == {
             'appid': apikey, 'units': _DEFAULT_UNITS}
+        assert client._service_uris['forecast_5d'] == (
+            'https://{}/data/2.5/forecast'.format(apihost))
+        assert client._service_uris['city_list'] == (
+            client.available_services['city_list']['uri'])
         assert client.last_uri_call is None
 
         client = OpenWeatherMapClient(
@@ -41,12 +48,192 @@ class TestOpenWeatherMapClient():
         client = OpenWeatherMapClient(apikey, max_retries=-1)
         assert client.max_retries == _DEFAULT_MAX_RETRIES
 
+        # query parameters, service ones first
+        params = {'lat': 1.0, 'lon': 2.0}
+        query_params = client._build_query_params(params, with_units=False)
+        assert list(query_params) == ['lat', 'lon', 'appid']
+        assert params == {'lat': 1.0, 'lon': 2.0}
+        assert client._build_query_params() == client._base_uri_params
+
+        # last called uri hides API key
+        client._set_last_uri_call(
+            'https://{}/data'.format(apihost), {'id': 42, 'appid': apikey})
+        assert client.last_uri_call == (
+            'https://{}/data?id=42&appid=XxX'.format(apihost))
+        assert client.last_uri_call_tries == 0
+
+    def test_openweathermap_client_invalid_params(self, apikey):
+        """Test api client parameters checks (before any request)."""
+
+        client = OpenWeatherMapClient(apikey)
+        for search_type in ('wrong', ['like']):
+            with pytest.raises(ValueError):
+                client.get_forecast_by_city_name(
+                    'Montcuq', search_type=search_type)
+            with pytest.raises(ValueError):
+                client.get_current_weather_by_city_name(
+                    'Montcuq', search_type=search_type)
+        for cluster in ('wrong', {'yes': True}):
+            with pytest.raises(ValueError):
+                client.get_current_weather_within_box(
+                    (12, 32, 15, 37), 10, cluster=cluster)
+            with pytest.raises(ValueError):
+                client.get_current_weather_within_circle(
+                    55.5, 37.5, cluster=cluster)
+
+    def test_openweathermap_client_session(self, apikey, apihost):
+        """Test api client HTTP session."""
+
+        with OpenWeatherMapClient(apikey, host=apihost) as client:
+            session = client._session
+            assert session.get_adapter('http://') is not None
+            assert session.get_adapter('https://') is not None
+            adapter = session.get_adapter('https://')
+            assert adapter.max_retries.total == client.max_retries
+            client.max_retries = 0
+            assert adapter.max_retries.total == 0
+            assert session.get_adapter('http://').max_retries.total == 0
+            client.max_retries = -1
+            assert client.max_retries == _DEFAULT_MAX_RETRIES
+            assert adapter.max_retries.total == _DEFAULT_MAX_RETRIES
+            assert 'gzip' in session.headers['Accept-Encoding']
+            adapter.poolmanager.connection_from_url('https://' + apihost)
+            assert len(adapter.poolmanager.pools) == 1
+        # pooled connections are released on exit
+        assert len(adapter.poolmanager.pools) == 0
+
+    def test_openweathermap_client_city_list_cache(self, apikey, tmpdir):
+        """Test api client city list cache."""
+
+        client = OpenWeatherMapClient(apikey, cache_dir=str(tmpdir))
+        assert client._read_city_list_validators() is None
+        assert client._city_list_request_headers(None) == {}
+
+        # nothing cached without validators
+        client._write_city_list_cache({}, b'[{"id": 1}]')
+        assert client._read_city_list_validators() is None
+
+        client._write_city_list_cache({'ETag': '"v1"'}, b'[{"id": 1}]')
+        validators = client._read_city_list_validators()
+        assert validators == {'etag': '"v1"', 'last_modified': None}
+        assert client._city_list_request_headers(validators) == {
+            'If-None-Match': '"v1"'}
+        assert client._read_city_list_data() == [{'id': 1}]
+
+        # validators are ignored without cached data
+        tmpdir.join('city.list.json').remove()
+        assert client._read_city_list_validators() is None
+
+        # cache disabled
+        client = OpenWeatherMapClient(apikey, cache_dir=None)
+        client._write_city_list_cache({'ETag': '"v1"'}, b'[{"id": 1}]')
+        assert client._read_city_list_validators() is None
+
+    def test_openweathermap_client_city_list_iter_cache(
+            self, apikey, tmpdir):
+        """Test api client city list cache, while iterating over cities."""
+        pytest.importorskip('ijson')
+
+        class FakeResponse():
+            headers = {}
+
+            def __init__(self, status_code, content=b''):
+                self.status_code = status_code
+                self.raw = io.BytesIO(content)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *args):
+                pass
+
+        client = OpenWeatherMapClient(apikey, cache_dir=str(tmpdir))
+        client._write_city_list_cache({'ETag': '"v1"'}, b'[{"id": 1}]')
+        # cached data is never read when the list has been modified
+        client._read_city_list_data = None
+        client._get = lambda uri, **kwargs: FakeResponse(
+            200, gzip.compress(b'[{"id": 2}]'))
+        assert list(client.iter_city_list()) == [{'id': 2}]
+
+        del client._read_city_list_data
+        client._get = lambda uri, **kwargs: FakeResponse(304)
+        assert list(client.iter_city_list()) == [{'id': 1}]
+
+    def test_openweathermap_client_response_cache(self, apikey, city_info):
+        """Test api client in-memory response cache."""
+
+        class FakeResponse():
+            content = b'{"id": 6434841, "name": "Montcuq"}'
+
+        def fake_get(uri, **kwargs):
+            calls.append(uri)
+            return FakeResponse()
+
+        calls = []
+        client = OpenWeatherMapClient(apikey)
+        assert client.cache_ttl == 600
+        client._get = fake_get
+
+        result = client.get_current_weather_by_city_id(city_info['_id'])
+        assert result['city_id'] == city_info['_id']
+        # cached response is loaded again: results are never shared
+        result.pop('city_id')
+        cached_result = client.get_current_weather_by_city_id(city_info['_id'])
+        assert cached_result is not result
+        assert cached_result['city_id'] == city_info['_id']
+        assert len(calls) == 1
+        # other parameters, other cache entry
+        client.get_current_weather_by_city_id(42)
+        assert len(calls) == 2
+        # not cacheable service
+        client.get_forecast_by_city_id(city_info['_id'])
+        client.get_forecast_by_city_id(city_info['_id'])
+        assert len(calls) == 4
+
+        # cache disabled
+        client = OpenWeatherMapClient(apikey, cache_ttl=None)
+        assert client._cache is None
+        client._get = fake_get
+        client.get_current_weather_by_city_id(city_info['_id'])
+        client.get_current_weather_by_city_id(city_info['_id'])
+        assert len(calls) == 6
+
+    def test_openweathermap_client_load_current_weather(self, apikey):
+        """Test api client current weather loads by groups of cities."""
+
+        def fake_get_group(city_ids):
+            groups.append(city_ids)
+            return {'datas': [
+                {'city_id': city_id} for city_id in city_ids
+                if city_id != 999]}
+
+        groups = []
+        client = OpenWeatherMapClient(apikey)
+        client.get_current_weather_group = fake_get_group
+
+        futures = [client.load_current_weather(city_id)
+                   for city_id in [*range(1, 26), '3', 999]]
+        assert not any(future.done() for future in futures)
+        client.flush()
+        assert [len(city_ids) for city_ids in groups] == [20, 6]
+        assert futures[0].result() == {'city_id': 1}
+        assert futures[-2].result() == {'city_id': 3}
+        # same city ID loaded twice: results are not shared
+        assert futures[-2].result() is not futures[2].result()
+        with pytest.raises(OpenWeatherMapClientError):
+            futures[-1].result()
+        # nothing left to flush
+        client.flush()
+        assert len(groups) == 2
+
     @pytest.mark.slow
-    def test_openweathermap_client_city_list(self, apikey, apihost):
+    def test_openweathermap_client_city_list(
+            self, apikey, apihost, tmpdir):
         """Test api client get city list."""
 
         # get api client
-        client = OpenWeatherMapClient(apikey, host=apihost)
+        client = OpenWeatherMapClient(
+            apikey, host=apihost, cache_dir=str(tmpdir))
 
         # get cities list
         result_data = client.get_city_list()
@@ -57,11 +244,13 @@ class TestOpenWeatherMapClient():
         assert result_data[0]['coord']['latitude'] is not None
         assert result_data[0]['coord']['longitude'] is not None
 
-    def test_openweathermap_client_city_list_faster(self, apikey, apihost):
+    def test_openweathermap_client_city_list_faster(
+            self, apikey, apihost, tmpdir):
         """Test api client get city list (faster mode)."""
 
         # get api client
-        client = OpenWeatherMapClient(apikey, host=apihost)
+        client = OpenWeatherMapClient(
+            apikey, host=apihost, cache_dir=str(tmpdir))
 
         # get cities list
         # not validating data with marshmallow is faster
@@ -74,6 +263,24 @@ class TestOpenWeatherMapClient():
         assert result_data[0]['coord']['lat'] is not None
         assert result_data[0]['coord']['lon'] is not None
 
+    @pytest.mark.slow
+    def test_openweathermap_client_city_list_iter(
+            self, apikey, apihost, tmpdir):
+        """Test api client iterate over city list."""
+
+        # get api client
+        client = OpenWeatherMapClient(
+            apikey, host=apihost, cache_dir=str(tmpdir))
+
+        # iterate over cities list, streamed when possible
+        city_data = next(client.iter_city_list())
+        assert city_data['id'] is not None
+        assert city_data['coord']['lat'] is not None
+
+        # get cities by ID
+        city_index = client.city_id_index()
+        assert city_index[city_data['id']] == city_data
+
     def test_openweathermap_client_forecast(self, apikey, apihost, city_info):
         """Test api client get forecast data."""
 
@@ -0,0 +1,120 @@
+"""Tests for OpenWeatherMap response schemas."""
+
+import datetime as dt
+
+import marshmallow as ma
+import pytest
+
+from openweathermap_client.schemas import (
+    CURRENT_WEATHER_SCHEMA, CURRENT_WEATHER_SEARCH_SCHEMA,
+    AIR_POLLUTION_OZONE_SCHEMA, UV_INDEX_SCHEMA, CurrentWeatherSchema,
+    _parse_rfc3339)
+
+
+CURRENT_WEATHER_DATA = {
+    'id': 6434841,
+    'name': 'Montcuq',
+    'coord': {'lon': 1.21667, 'lat': 44.333328},
+    'dt': 1485789600,
+    'main': {
+        'temp': 280.32, 'pressure': 1012, 'humidity': 81,
+        'temp_min': 279.15, 'temp_max': 281.15},
+    'weather': [{
+        'id': 300, 'main': 'Drizzle',
+        'description': 'light intensity drizzle', 'icon': '09d'}],
+    'clouds': {'all': 90},
+    'visibility': 10000,
+    'wind': {'speed': 4.1, 'deg': 80},
+    'rain': {'3h': 0.5},
+    'sys': {'country': 'FR', 'sunrise': 1485762037, 'sunset': 1485794875},
+}
+
+
+class TestSchemas():
+    """Response schemas tests."""
+
+    @staticmethod
+    def _ma_load(schema, data):
+        """Load data with marshmallow only (no generated loaders)."""
+        return ma.Schema.load(schema, data)
+
+    def test_schemas_fast_load(self):
+        """Test generated loaders return the same as marshmallow."""
+
+        schema = CURRENT_WEATHER_SCHEMA
+        assert schema._fast_load is not None
+        result = schema.load(CURRENT_WEATHER_DATA)
+        assert result == self._ma_load(schema, CURRENT_WEATHER_DATA)
+        assert result.errors == {}
+        assert result.data['city_id'] == 6434841
+        assert result.data['rain'] == {'rain_3h': 0.5}
+        assert result.data['main']['humidity'] == 81
+        assert isinstance(result.data['main']['humidity'], int)
+        assert isinstance(result.data['main']['pressure'], float)
+        assert result.data['sys']['sunrise'].tzinfo is not None
+
+        data = {'cnt': 1, 'list': [CURRENT_WEATHER_DATA]}
+        schema = CURRENT_WEATHER_SEARCH_SCHEMA
+        assert schema.load(data) == self._ma_load(schema, data)
+
+    def test_schemas_fast_load_errors(self):
+        """Test invalid data is loaded by marshmallow."""
+
+        data = dict(CURRENT_WEATHER_DATA, visibility=None, name=42)
+        result = CURRENT_WEATHER_SCHEMA.load(data)
+        assert set(result.errors) == {'visibility', 'name'}
+        assert 'visibility' not in result.data
+        assert result.data['city_id'] == 6434841
+
+    def test_schemas_fast_load_disabled(self):
+        """Test generated loaders can be disabled in schema Meta options."""
+
+        class MarshmallowCurrentWeatherSchema(CurrentWeatherSchema):
+            class Meta(CurrentWeatherSchema.Meta):
+                fast_load = False
+
+        schema = MarshmallowCurrentWeatherSchema()
+        assert schema._fast_load is None
+        result = schema.load(CURRENT_WEATHER_DATA)
+        assert result == CURRENT_WEATHER_SCHEMA.load(CURRENT_WEATHER_DATA)
+
+    def test_schemas_datetimes(self):
+        """Test timestamps and ISO 8601 datetimes are loaded as UTC."""
+
+        utc_dt = dt.datetime(2017, 6, 23, 12, tzinfo=dt.timezone.utc)
+        data = {
+            'lat': 37.75, 'lon': -122.37, 'date_iso': '2017-06-23T12:00:00Z',
+            'date': 1498219200, 'value': 10.16}
+        result = UV_INDEX_SCHEMA.load(data)
+        assert result.errors == {}
+        assert result.data['date'] == utc_dt
+        assert result.data['dt_timestamp'] == 1498219200
+
+        data = {
+            'time': '2017-06-23T12:00:00Z', 'data': 260.4,
+            'location': {'latitude': 0.0, 'longitude': 9.9351}}
+        result = AIR_POLLUTION_OZONE_SCHEMA.load(data)
+        assert result.errors == {}
+        assert result.data['time'] == utc_dt
+        assert result.data['time_iso8601'] == '2017-06-23T12:00:00Z'
+
+        # full datetime with timezone required (whatever the parser used)
+        for time in ('2017-06', '2016', '2017-06-23', '2017-06-23T12:00:00'):
+            result = AIR_POLLUTION_OZONE_SCHEMA.load(dict(data, time=time))
+            assert set(result.errors) == {'time'}
+
+    def test_schemas_parse_rfc3339(self):
+        """Test RFC 3339 datetimes parsing without ciso8601."""
+
+        utc = dt.timezone.utc
+        for value, microsecond in (
+                ('2016-01-01T00:00:00.5Z', 500000),
+                ('2016-01-01T00:00:00.1234Z', 123400),
+                ('2016-01-01T00:00:00.1234567Z', 123456)):
+            assert _parse_rfc3339(value) == dt.datetime(
+                2016, 1, 1, microsecond=microsecond, tzinfo=utc)
+        assert _parse_rfc3339('2016-01-01 02:00:00+02:00') == dt.datetime(
+            2016, 1, 1, tzinfo=utc)
+        for value in ('2016-01', '2016-01-01T00:00:00', '2016-01-01T00Z'):
+            with pytest.raises(ValueError):
+                _parse_rfc3339(value)
@@ -2,7 +2,7 @@
 
 import datetime as dt
 
-from openweathermap_client.utils import dt_from_timestamp
+from openweathermap_client.utils import dt_from_timestamp, UTC
 
 
 class TestUtils():
@@ -15,6 +15,7 @@ class TestUtils():
         dt_utcnow = dt.datetime.utcnow().replace(tzinfo=dt.timezone.utc)
         ts_utcnow = dt_utcnow.timestamp()
         assert dt_from_timestamp(ts_utcnow, ts_tz=dt.timezone.utc) == dt_utcnow
+        assert dt_from_timestamp(ts_utcnow, ts_tz=UTC) == dt_utcnow
         assert dt_from_timestamp(ts_utcnow) != dt_utcnow
 
         # without timezone awareness